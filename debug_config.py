@@ -1,29 +1,33 @@
 #!/usr/bin/env python3
 """调试配置读取问题"""
 
-import toml
+import sys
 from pathlib import Path
 
+try:
+    from feishu.config import Config, ConfigError
+except ImportError:  # 从源码目录直接运行脚本时包尚未安装，使用仓库中的src
+    sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+    from feishu.config import Config, ConfigError
+
 def debug_config():
     config_file = Path("config.toml")
     
     print(f"配置文件存在: {config_file.exists()}")
     
     if config_file.exists():
-        with open(config_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(config_file, 'rb') as f:
+            content = f.read().decode('utf-8')
             print(f"配置文件原始内容:\n{content}")
-            
-        config_data = toml.load(config_file)
-        print(f"解析后的配置数据: {config_data}")
         
-        print(f"是否包含'feishu'键: {'feishu' in config_data}")
-        if 'feishu' in config_data:
-            print(f"feishu配置: {config_data['feishu']}")
+        # 直接解析，不经过缓存，每次都能看到解析和配置段识别的DEBUG日志
+        try:
+            config = Config.parse(str(config_file))
+        except ConfigError as e:
+            print(f"配置加载失败: {e}")
+            return
         
-        print(f"是否包含'notifications'键: {'notifications' in config_data}")
-        if 'notifications' in config_data:
-            print(f"notifications配置: {config_data['notifications']}")
+        print(f"解析后的配置信息: {config.get_config_info()}")
 
 if __name__ == "__main__":
-    debug_config()
\ No newline at end of file
+    debug_config()
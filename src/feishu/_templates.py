@@ -0,0 +1,38 @@
+"""模板模块
+
+集中存放配置文件模板，供命令行初始化和安装脚本共用。
+"""
+
+# 示例配置内容
+DEFAULT_CONFIG = """# 飞书通知配置文件
+# 请根据实际情况修改以下配置
+
+[feishu]
+# 是否启用飞书通知
+enabled = true
+
+# 飞书机器人 webhook 地址列表
+# 获取方式：
+# 1. 在飞书群聊中添加机器人
+# 2. 选择"自定义机器人"
+# 3. 复制生成的 webhook 地址
+# 4. 将地址替换下面的占位符
+webhooks = [
+    "https://open.feishu.cn/open-apis/bot/v2/hook/YOUR_WEBHOOK_TOKEN_HERE"
+    # "https://open.feishu.cn/open-apis/bot/v2/hook/ANOTHER_WEBHOOK_TOKEN_HERE"  # 可添加多个webhook
+]
+
+# 可选配置项（如果需要的话）
+# [feishu.advanced]
+# # 消息发送间隔（秒）
+# interval = 1
+# 
+# # 重试次数
+# retry_count = 3
+# 
+# # 超时时间（秒）
+# timeout = 10
+"""
+
+# 预先编码的示例配置，写入文件时无需再次编码
+DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG.encode('utf-8')
@@ -6,19 +6,17 @@
 - 查看配置状态
 - 测试连接
 - 配置文件管理
-- 使用fire库处理命令行参数
+- 按子命令按需构建argparse解析器处理命令行参数
 """
 
+import argparse
 import os
 import sys
-from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import fire
 from loguru import logger
 
 from .config import Config, ConfigError
-from .notification import FeishuNotifier, NotificationError
 from .__init__ import __version__
 
 
@@ -30,11 +28,18 @@ class FeishuCLI:
     
     def __init__(self):
         """初始化CLI"""
+        self._file_sink_ready = False
         self._setup_logging()
-        logger.info("飞书命令行工具启动")
     
     def _setup_logging(self):
         """设置日志配置"""
+        self._setup_stderr_logging()
+        
+        # 文件日志在第一条日志产生时才创建，不输出日志的命令无需打开日志文件
+        logger.configure(patcher=self._ensure_file_sink)
+    
+    def _setup_stderr_logging(self):
+        """设置控制台日志"""
         # 移除默认的日志处理器
         logger.remove()
         
@@ -44,6 +49,16 @@ class FeishuCLI:
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
             level="DEBUG"
         )
+    
+    def _ensure_file_sink(self, record: dict) -> None:
+        """首次输出日志前添加文件日志
+        
+        Args:
+            record: 当前日志记录（作为loguru的patcher调用）
+        """
+        if self._file_sink_ready:
+            return
+        self._file_sink_ready = True
         
         # 获取配置目录路径，确保目录存在
         config_dir = Config.get_default_config_dir()
@@ -78,6 +93,9 @@ class FeishuCLI:
             feishu send "**粗体文本**" --type markdown
             feishu send --file message.txt
         """
+        # 仅发送消息时才加载网络相关模块
+        from .notification import FeishuNotifier, NotificationError
+        
         try:
             # 从文件读取消息内容
             if file:
@@ -94,7 +112,7 @@ class FeishuCLI:
                     sys.exit(1)
             
             # 验证消息内容
-            if not message or not message.strip():
+            if not message or message.isspace():
                 logger.error("消息内容不能为空")
                 print("❌ 消息内容不能为空")
                 sys.exit(1)
@@ -108,22 +126,29 @@ class FeishuCLI:
                 print("❌ 飞书通知未启用，请检查配置文件")
                 sys.exit(1)
             
-            notifier = FeishuNotifier(app_config.get_webhooks())
-            
-            # 发送消息
-            if message_type == "markdown":
-                success = notifier.send_markdown(message)
-            else:
-                success = notifier.send_text(message)
-            
-            if success:
-                logger.info("消息发送成功")
-                print("✅ 消息发送成功")
-                return True
-            else:
-                logger.error("消息发送失败")
-                print("❌ 消息发送失败")
+            # 使用只读webhook元组，无需复制；没有webhook时不创建通知器
+            webhooks = app_config.get_webhooks()
+            if not webhooks:
+                logger.error("未配置任何webhook，请检查配置文件")
+                print("❌ 未配置任何webhook，请检查配置文件")
                 sys.exit(1)
+            
+            # 退出时关闭通知器，释放线程池和连接
+            with FeishuNotifier(webhooks) as notifier:
+                # 发送消息
+                if message_type == "markdown":
+                    success = notifier.send_markdown(message)
+                else:
+                    success = notifier.send_text(message)
+                
+                if success:
+                    logger.info("消息发送成功")
+                    print("✅ 消息发送成功")
+                    return True
+                else:
+                    logger.error("消息发送失败")
+                    print("❌ 消息发送失败")
+                    sys.exit(1)
                 
         except ConfigError as e:
             logger.error(f"配置错误: {e}")
@@ -153,21 +178,23 @@ class FeishuCLI:
                 config_info = {
                     'enabled': app_config.is_enabled(),
                     'webhook_count': len(webhooks),
-                    'webhooks': webhooks,
+                    'webhooks': list(map(Config._mask_webhook, webhooks)),
                 }
             
-            # 显示状态信息
-            print("\n=== 飞书通知配置状态 ===")
-            print(f"配置文件: {Config.get_config_path()}")
-            print(f"飞书通知: {'✅ 启用' if config_info['enabled'] else '❌ 禁用'}")
-            print(f"Webhook数量: {config_info['webhook_count']}")
+            # 显示状态信息，汇总后一次性输出
+            lines = [
+                "\n=== 飞书通知配置状态 ===",
+                f"配置文件: {Config.get_config_path()}",
+                f"飞书通知: {'✅ 启用' if config_info['enabled'] else '❌ 禁用'}",
+                f"Webhook数量: {config_info['webhook_count']}",
+            ]
             
             if config_info['webhooks']:
-                print("\nWebhook列表:")
-                for i, webhook in enumerate(config_info['webhooks'], 1):
-                    print(f"  {i}. {webhook}")
+                lines.append("\nWebhook列表:")
+                lines.extend(f"  {i}. {webhook}" for i, webhook in enumerate(config_info['webhooks'], 1))
             
-            print()
+            lines.append("")
+            print("\n".join(lines))
             
         except ConfigError as e:
             logger.error(f"配置错误: {e}")
@@ -187,6 +214,8 @@ class FeishuCLI:
         Examples:
             feishu test
         """
+        from .notification import FeishuNotifier, NotificationError
+        
         try:
             # 加载配置并创建通知器
             app_config = Config.load()
@@ -197,22 +226,29 @@ class FeishuCLI:
                 print("❌ 飞书通知未启用，请检查配置文件")
                 sys.exit(1)
             
-            notifier = FeishuNotifier(app_config.get_webhooks())
+            # 使用只读webhook元组，无需复制；没有webhook时不创建通知器
+            webhooks = app_config.get_webhooks()
+            if not webhooks:
+                logger.error("未配置任何webhook，请检查配置文件")
+                print("❌ 未配置任何webhook，请检查配置文件")
+                sys.exit(1)
             
             # 创建测试消息
+            from datetime import datetime
             test_message = f"飞书机器人测试消息\n发送时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             
-            # 发送测试消息
-            success = notifier.send_text(test_message)
-            
-            if success:
-                logger.info("测试消息发送成功")
-                print("✅ 测试成功！飞书机器人配置正常")
-                return True
-            else:
-                logger.error("测试消息发送失败")
-                print("❌ 测试失败！请检查配置")
-                sys.exit(1)
+            # 发送测试消息，退出时关闭通知器，释放线程池和连接
+            with FeishuNotifier(webhooks) as notifier:
+                success = notifier.send_text(test_message)
+                
+                if success:
+                    logger.info("测试消息发送成功")
+                    print("✅ 测试成功！飞书机器人配置正常")
+                    return True
+                else:
+                    logger.error("测试消息发送失败")
+                    print("❌ 测试失败！请检查配置")
+                    sys.exit(1)
                 
         except ConfigError as e:
             logger.error(f"配置错误: {e}")
@@ -265,24 +301,25 @@ class FeishuCLI:
             print(f"\n📁 配置文件路径: {config_path}")
             
             if not os.path.exists(config_path):
-                print("❌ 配置文件不存在")
-                print("💡 使用 'feishu config init' 初始化配置文件")
+                print("❌ 配置文件不存在\n💡 使用 'feishu config init' 初始化配置文件")
                 return
             
             # 加载配置
             app_config = Config.load()
             config_info = app_config.get_config_info()
             
-            print("\n=== 飞书通知配置 ===")
-            print(f"状态: {'✅ 启用' if config_info['enabled'] else '❌ 禁用'}")
-            print(f"Webhook数量: {config_info['webhook_count']}")
+            lines = [
+                "\n=== 飞书通知配置 ===",
+                f"状态: {'✅ 启用' if config_info['enabled'] else '❌ 禁用'}",
+                f"Webhook数量: {config_info['webhook_count']}",
+            ]
             
             if config_info['webhooks']:
-                print("\nWebhook列表:")
-                for i, webhook in enumerate(config_info['webhooks'], 1):
-                    print(f"  {i}. {webhook}")
+                lines.append("\nWebhook列表:")
+                lines.extend(f"  {i}. {webhook}" for i, webhook in enumerate(config_info['webhooks'], 1))
             
-            print()
+            lines.append("")
+            print("\n".join(lines))
             
         except ConfigError as e:
             logger.error(f"配置错误: {e}")
@@ -295,6 +332,8 @@ class FeishuCLI:
     
     def _config_init(self) -> None:
         """初始化配置文件"""
+        from ._templates import DEFAULT_CONFIG_BYTES
+        
         try:
             config_dir = str(Config.get_default_config_dir())
             config_file = os.path.join(config_dir, "config.toml")
@@ -309,39 +348,11 @@ class FeishuCLI:
                     print("取消初始化")
                     return
             
-            # 创建示例配置内容
-            example_config = """# 飞书通知配置文件
-# 请根据实际情况修改以下配置
-
-[feishu]
-# 是否启用飞书通知
-enabled = true
-
-# 飞书机器人 webhook 地址列表
-# 获取方式：
-# 1. 在飞书群聊中添加机器人
-# 2. 选择"自定义机器人"
-# 3. 复制生成的 webhook 地址
-# 4. 将地址替换下面的占位符
-webhooks = [
-    "https://open.feishu.cn/open-apis/bot/v2/hook/YOUR_WEBHOOK_TOKEN_HERE"
-    # "https://open.feishu.cn/open-apis/bot/v2/hook/ANOTHER_WEBHOOK_TOKEN_HERE"  # 可添加多个webhook
-]
-
-# 可选配置项（如果需要的话）
-# [feishu.advanced]
-# # 消息发送间隔（秒）
-# interval = 1
-# 
-# # 重试次数
-# retry_count = 3
-# 
-# # 超时时间（秒）
-# timeout = 10
-"""
+            with open(config_file, 'wb') as f:
+                f.write(DEFAULT_CONFIG_BYTES)
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                f.write(example_config)
+            # 新建配置文件后重新查找并加载配置
+            Config.clear_cache()
             
             print(f"✅ 配置文件已创建: {config_file}")
             print("\n🔧 请编辑配置文件，将 YOUR_WEBHOOK_TOKEN_HERE 替换为真实的飞书机器人webhook地址")
@@ -359,20 +370,25 @@ webhooks = [
             config_path = Config.get_config_path()
             config_dir = str(Config.get_default_config_dir())
             
-            print(f"\n📁 当前配置文件路径: {config_path}")
-            print(f"📂 默认配置目录: {config_dir}")
+            lines = [
+                f"\n📁 当前配置文件路径: {config_path}",
+                f"📂 默认配置目录: {config_dir}",
+            ]
             
             if os.path.exists(config_path):
-                print("✅ 配置文件存在")
+                lines.append("✅ 配置文件存在")
             else:
-                print("❌ 配置文件不存在")
-                print("💡 使用 'feishu config init' 初始化配置文件")
-            
-            print("\n🔍 配置文件查找顺序:")
-            print("  1. 环境变量 FEISHU_CONFIG_PATH")
-            print(f"  2. {os.path.join(config_dir, 'config.toml')} (推荐)")
-            print("  3. ./config.toml (当前目录)")
-            print()
+                lines.append("❌ 配置文件不存在")
+                lines.append("💡 使用 'feishu config init' 初始化配置文件")
+            
+            lines += [
+                "\n🔍 配置文件查找顺序:",
+                "  1. 环境变量 FEISHU_CONFIG_PATH",
+                f"  2. {os.path.join(config_dir, 'config.toml')} (推荐)",
+                "  3. ./config.toml (当前目录)",
+                "",
+            ]
+            print("\n".join(lines))
             
         except Exception as e:
             logger.error(f"获取配置路径失败: {e}")
@@ -380,10 +396,80 @@ webhooks = [
             sys.exit(1)
 
 
+def _add_send_arguments(parser: argparse.ArgumentParser) -> None:
+    """添加send命令的参数"""
+    parser.add_argument("message", nargs="?", default=None, help="要发送的消息内容")
+    parser.add_argument(
+        "--type", "--message-type", "--message_type",
+        dest="message_type", default="text", choices=["text", "markdown"],
+        help="消息类型，支持 text, markdown"
+    )
+    parser.add_argument("--file", default=None, help="从文件读取消息内容")
+    parser.add_argument("--config", default=None, help="自定义配置文件路径")
+
+
+def _add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """添加config命令的参数"""
+    parser.add_argument("action", nargs="?", default="show", help="操作类型，支持 show, init, path")
+
+
+# 子命令及其参数构建函数，只为实际调用的子命令构建解析器
+_COMMANDS: Dict[str, Optional[Callable[[argparse.ArgumentParser], None]]] = {
+    "send": _add_send_arguments,
+    "status": None,
+    "test": None,
+    "version": None,
+    "config": _add_config_arguments,
+}
+
+
+def _command_summary(name: str) -> str:
+    """获取子命令说明（方法文档字符串的第一行）"""
+    doc = getattr(FeishuCLI, name).__doc__ or ""
+    return doc.strip().splitlines()[0] if doc.strip() else ""
+
+
+def _print_usage() -> None:
+    """显示命令列表"""
+    lines = ["用法: feishu <命令> [参数]", "", "可用命令:"]
+    lines.extend(f"  {name:<10}{_command_summary(name)}" for name in _COMMANDS)
+    lines.append("\n使用 'feishu <命令> --help' 查看命令帮助")
+    print("\n".join(lines))
+
+
+def _parse_args(argv: List[str]) -> Tuple[str, Dict[str, Any]]:
+    """解析命令行参数
+    
+    Args:
+        argv: 不含程序名的命令行参数
+        
+    Returns:
+        Tuple[str, Dict[str, Any]]: (子命令名称, 传给子命令方法的关键字参数)
+    """
+    if not argv or argv[0] in ("-h", "--help"):
+        _print_usage()
+        sys.exit(0)
+    
+    name, rest = argv[0], argv[1:]
+    if name not in _COMMANDS:
+        print(f"❌ 不支持的命令: {name}")
+        _print_usage()
+        sys.exit(2)
+    
+    parser = argparse.ArgumentParser(prog=f"feishu {name}", description=_command_summary(name))
+    add_arguments = _COMMANDS[name]
+    if add_arguments is not None:
+        add_arguments(parser)
+    
+    return name, vars(parser.parse_args(rest))
+
+
 def main():
     """命令行入口点"""
+    name, kwargs = _parse_args(sys.argv[1:])
+    
     try:
-        fire.Fire(FeishuCLI)
+        getattr(FeishuCLI(), name)(**kwargs)
     except KeyboardInterrupt:
         print("\n❌ 操作被用户中断")
         sys.exit(1)
@@ -7,15 +7,35 @@
 - 提供配置访问接口
 """
 
+import functools
+import json
 import os
-import toml
+import re
 from pathlib import Path
-from typing import List, Optional
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
 from loguru import logger
 
 
+# 默认配置目录和配置文件（XDG标准），导入时计算一次
+_DEFAULT_CONFIG_DIR = Path.home() / ".config" / "smallfeishu"
+_DEFAULT_CONFIG_FILE = _DEFAULT_CONFIG_DIR / "config.toml"
+
+# 已验证配置的编译缓存，按 (配置文件路径, mtime, 大小) 判断是否过期
+_CACHE_PATH = Path.home() / ".cache" / "smallfeishu" / "config.json"
+
+# 飞书webhook地址格式：HTTPS协议、飞书域名、机器人hook路径。主机名只允许字母、
+# 数字、点和连字符，避免反斜杠、@等字符把请求引到其他主机；需配合fullmatch使用
+_WEBHOOK_RE = re.compile(r'https://[A-Za-z0-9.-]*\.feishu\.cn(?::\d+)?/open-apis/bot/v2/hook/\S+')
+
+# webhook地址长度上限，超长输入直接判定无效，不进入正则匹配
+_MAX_WEBHOOK_URL_LENGTH = 512
+
+# 进程内已加载的配置对象，键与编译缓存相同
+_LOAD_CACHE: Dict[Tuple[str, int, int], "Config"] = {}
+
+
 class ConfigError(Exception):
     """配置相关错误"""
     pass
@@ -27,7 +47,7 @@ class Config:
     负责加载和管理飞书机器人的配置信息。
     """
     
-    def __init__(self, feishu_enabled: bool, webhooks: List[str]):
+    def __init__(self, feishu_enabled: bool, webhooks: Sequence[str]):
         """初始化配置
         
         Args:
@@ -35,7 +55,8 @@ class Config:
             webhooks: 飞书webhook地址列表
         """
         self.feishu_enabled = feishu_enabled
-        self.webhooks = webhooks
+        # 元组不可变，可以直接返回给调用方并在线程间共享
+        self.webhooks: Tuple[str, ...] = tuple(webhooks)
     
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "Config":
@@ -53,20 +74,56 @@ class Config:
         if config_path is None:
             config_path = cls._find_config_file()
         
-        config_file = Path(config_path)
-        
-        # 检查配置文件是否存在
-        if not config_file.exists():
+        # 检查配置文件是否存在，同一次stat的结果用作缓存键
+        try:
+            cache_key = cls._cache_key(config_path)
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"配置文件不存在: {config_path}")
             raise ConfigError(f"配置文件不存在: {config_path}")
         
+        # 配置文件未变化时直接使用缓存，跳过解析和验证
+        if cache_key in _LOAD_CACHE:
+            return _LOAD_CACHE[cache_key]
+        
+        cached = cls._read_cache(cache_key)
+        if cached is not None:
+            logger.info(f"成功加载配置文件(缓存): {config_path}")
+            config = cls(*cached)
+            _LOAD_CACHE[cache_key] = config
+            return config
+        
+        config = cls.parse(config_path)
+        cls._write_cache(cache_key, config.feishu_enabled, list(config.webhooks))
+        _LOAD_CACHE[cache_key] = config
+        return config
+    
+    @classmethod
+    def parse(cls, config_path: str) -> "Config":
+        """直接解析并验证配置文件，不读写任何缓存
+        
+        Args:
+            config_path: 配置文件路径
+            
+        Returns:
+            Config: 配置对象
+            
+        Raises:
+            ConfigError: 配置文件无法读取、格式错误或内容无效时抛出
+        """
+        # TOML解析器只在实际解析时需要，此时再导入
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        
         # 读取配置文件
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = toml.load(f)
+            # 一次性读入内存后解析，避免逐行读取流
+            with open(config_path, 'rb') as f:
+                config_data = tomllib.loads(f.read().decode('utf-8'))
             logger.info(f"成功加载配置文件: {config_path}")
-            logger.debug(f"配置文件内容: {config_data}")
-        except toml.TomlDecodeError as e:
+            logger.debug("配置文件内容: {}", config_data)
+        except tomllib.TOMLDecodeError as e:
             logger.error(f"配置文件格式错误: {e}")
             raise ConfigError(f"配置文件格式错误: {e}")
         except Exception as e:
@@ -86,7 +143,7 @@ class Config:
             logger.error("配置文件中缺少飞书配置段")
             raise ConfigError("配置文件中缺少飞书配置段: [feishu] 或 [notifications.feishu]")
         
-        logger.debug(f"读取到的飞书配置: {feishu_config}")
+        logger.debug("读取到的飞书配置: {}", feishu_config)
         
         # 提取配置项
         feishu_enabled = feishu_config.get('enabled', False)
@@ -98,6 +155,73 @@ class Config:
         return cls(feishu_enabled, webhooks)
     
     @staticmethod
+    def _cache_key(config_path: str) -> Tuple[str, int, int]:
+        """计算配置缓存键
+        
+        Args:
+            config_path: 配置文件路径
+            
+        Returns:
+            Tuple[str, int, int]: (绝对路径, 修改时间纳秒, 文件大小)
+        """
+        st = os.stat(config_path)
+        return (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    def _read_cache(cache_key: Tuple[str, int, int]) -> Optional[Tuple[bool, List[str]]]:
+        """读取配置缓存
+        
+        缓存文件不可信：内容格式不符或未通过配置验证时视为缓存无效。
+        
+        Args:
+            cache_key: 当前配置文件的缓存键
+            
+        Returns:
+            Optional[Tuple[bool, List[str]]]: 缓存有效时返回 (enabled, webhooks)，否则返回None
+        """
+        try:
+            with open(_CACHE_PATH, 'rb') as f:
+                path, mtime_ns, size, feishu_enabled, webhooks = json.load(f)
+        except (OSError, ValueError, TypeError):
+            return None
+        
+        if (path, mtime_ns, size) != cache_key:
+            return None
+        
+        if not (
+            isinstance(feishu_enabled, bool) and
+            isinstance(webhooks, list) and
+            all(isinstance(w, str) for w in webhooks)
+        ):
+            return None
+        
+        try:
+            Config._validate_config(feishu_enabled, webhooks)
+        except ConfigError:
+            return None
+        
+        return feishu_enabled, webhooks
+    
+    @staticmethod
+    def _write_cache(cache_key: Tuple[str, int, int], feishu_enabled: bool, webhooks: List[str]) -> None:
+        """原子写入配置缓存，写入失败不影响配置加载
+        
+        Args:
+            cache_key: 当前配置文件的缓存键
+            feishu_enabled: 是否启用飞书通知
+            webhooks: webhook地址列表
+        """
+        tmp_path = _CACHE_PATH.with_name(_CACHE_PATH.name + ".tmp")
+        try:
+            _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump([*cache_key, feishu_enabled, webhooks], f)
+            os.replace(tmp_path, _CACHE_PATH)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("写入配置缓存失败: {}", e)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _find_config_file() -> str:
         """查找配置文件
         
@@ -106,6 +230,9 @@ class Config:
         2. ~/.config/smallfeishu/config.toml (XDG标准)
         3. ./config.toml (当前目录)
         
+        查找结果在进程内缓存，环境变量和工作目录只在首次调用时读取。
+        配置文件发生变化后需调用 ``Config.clear_cache()``。
+        
         Returns:
             str: 配置文件路径
             
@@ -114,26 +241,34 @@ class Config:
         """
         # 1. 检查环境变量
         env_config = os.getenv('FEISHU_CONFIG_PATH')
-        if env_config and Path(env_config).exists():
-            logger.debug(f"使用环境变量指定的配置文件: {env_config}")
+        if env_config and os.path.exists(env_config):
+            logger.debug("使用环境变量指定的配置文件: {}", env_config)
             return env_config
         
         # 2. 检查XDG标准配置目录
-        xdg_config = Path.home() / ".config" / "smallfeishu" / "config.toml"
+        xdg_config = _DEFAULT_CONFIG_FILE
         if xdg_config.exists():
-            logger.debug(f"使用XDG标准配置文件: {xdg_config}")
+            logger.debug("使用XDG标准配置文件: {}", xdg_config)
             return str(xdg_config)
         
         # 3. 检查当前目录
-        local_config = Path("config.toml")
-        if local_config.exists():
-            logger.debug(f"使用当前目录配置文件: {local_config}")
-            return str(local_config)
+        if os.path.exists("config.toml"):
+            logger.debug("使用当前目录配置文件: config.toml")
+            return "config.toml"
         
         # 如果都不存在，返回XDG标准路径（用于错误提示）
         logger.debug("未找到配置文件，返回默认XDG路径")
         return str(xdg_config)
     
+    @staticmethod
+    def clear_cache() -> None:
+        """清空进程内的配置缓存和配置文件查找结果
+        
+        不删除磁盘上的编译缓存，该缓存按文件修改时间和大小自动失效。
+        """
+        _LOAD_CACHE.clear()
+        Config._find_config_file.cache_clear()
+    
     @staticmethod
     def get_config_path() -> str:
         """获取配置文件路径
@@ -150,7 +285,7 @@ class Config:
         Returns:
             Path: 默认配置目录路径
         """
-        return Path.home() / ".config" / "smallfeishu"
+        return _DEFAULT_CONFIG_DIR
     
     @staticmethod
     def _validate_config(feishu_enabled: bool, webhooks: List[str]) -> None:
@@ -168,13 +303,18 @@ class Config:
             logger.error("启用飞书通知时必须配置至少一个webhook")
             raise ConfigError("启用飞书通知时必须配置至少一个webhook")
         
-        # 验证webhook URL格式
-        for webhook in webhooks:
-            if not Config._is_valid_webhook_url(webhook):
-                logger.error(f"无效的webhook URL: {webhook}")
-                raise ConfigError(f"无效的webhook URL: {webhook}")
+        # 未启用时webhook不会被使用，无需逐个校验
+        if not feishu_enabled:
+            logger.debug("配置验证通过: enabled=False, webhooks={}个（未启用，跳过webhook校验）", len(webhooks))
+            return
+        
+        # 验证webhook URL格式，报告第一个无效地址
+        invalid = next(filter(lambda w: not Config._is_valid_webhook_url(w), webhooks), None)
+        if invalid is not None:
+            logger.error(f"无效的webhook URL: {invalid}")
+            raise ConfigError(f"无效的webhook URL: {invalid}")
         
-        logger.debug(f"配置验证通过: enabled={feishu_enabled}, webhooks={len(webhooks)}个")
+        logger.debug("配置验证通过: enabled={}, webhooks={}个", feishu_enabled, len(webhooks))
     
     @staticmethod
     def _is_valid_webhook_url(url: str) -> bool:
@@ -186,24 +326,24 @@ class Config:
         Returns:
             bool: URL是否有效
         """
-        try:
-            parsed = urlparse(url)
-            # 检查是否为HTTPS协议且包含飞书域名
-            return (
-                parsed.scheme == 'https' and
-                'feishu.cn' in parsed.netloc and
-                '/open-apis/bot/v2/hook/' in parsed.path
-            )
-        except Exception:
+        if not (
+            isinstance(url, str) and
+            len(url) < _MAX_WEBHOOK_URL_LENGTH and
+            _WEBHOOK_RE.fullmatch(url) is not None
+        ):
             return False
+        
+        # 再以URL解析结果核对主机名，确保请求实际发往飞书域名
+        hostname = urlsplit(url).hostname
+        return hostname is not None and hostname.endswith('.feishu.cn')
     
-    def get_webhooks(self) -> List[str]:
+    def get_webhooks(self) -> Tuple[str, ...]:
         """获取webhook列表
         
         Returns:
-            List[str]: webhook地址列表
+            Tuple[str, ...]: webhook地址元组
         """
-        return self.webhooks.copy()
+        return self.webhooks
     
     def is_enabled(self) -> bool:
         """检查飞书通知是否启用
@@ -222,10 +362,11 @@ class Config:
         return {
             'enabled': self.feishu_enabled,
             'webhook_count': len(self.webhooks),
-            'webhooks': [self._mask_webhook(webhook) for webhook in self.webhooks]
+            'webhooks': list(map(Config._mask_webhook, self.webhooks))
         }
     
-    def _mask_webhook(self, webhook: str) -> str:
+    @staticmethod
+    def _mask_webhook(webhook: str) -> str:
         """遮蔽webhook中的敏感信息
         
         Args:
@@ -0,0 +1,593 @@
+"""通知模块
+
+负责通过webhook向飞书群发送消息。
+主要功能：
+- 发送文本、富文本和Markdown消息
+- 支持同时发送到多个webhook
+- 复用HTTP连接，处理请求错误
+- 可选的异步发送（需要安装httpx）
+- 格式化消息文本
+"""
+
+import asyncio
+import functools
+import importlib.util
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import Config
+
+# 安装fast可选依赖（orjson）时用orjson编解码，否则使用标准库。两条路径输出相同的bytes：
+# 紧凑分隔符、不转义非ASCII字符、非字符串键转为字符串；无法序列化时统一抛出ValueError
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        """序列化为UTF-8编码的JSON（orjson直接输出bytes）
+        
+        Raises:
+            ValueError: 内容无法序列化为JSON时抛出
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError as e:
+            raise ValueError(f"消息内容无法序列化为JSON: {e}") from e
+    
+    def _loads(data: bytes) -> Any:
+        """从bytes解析JSON"""
+        return orjson.loads(data)
+except ImportError:  # 未安装orjson时使用标准库
+    def _dumps(obj: Any) -> bytes:
+        """序列化为UTF-8编码的JSON
+        
+        Raises:
+            ValueError: 内容无法序列化为JSON时抛出
+        """
+        try:
+            return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"消息内容无法序列化为JSON: {e}") from e
+    
+    def _loads(data: bytes) -> Any:
+        """从bytes解析JSON"""
+        return json.loads(data)
+
+try:
+    import httpx
+except ImportError:  # 未安装httpx时不提供异步通知器
+    httpx = None
+
+# webhook请求的重试策略：连接失败和表示"未处理"的状态码（限流、网关错误）
+# 按带随机抖动的指数退避重试，单次等待不超过30秒；读取超时和500不重试，
+# 避免服务端已处理时重复发送消息
+_RETRY = Retry(
+    total=3,
+    connect=2,
+    read=0,
+    backoff_factor=0.3,
+    backoff_jitter=0.2,
+    backoff_max=30,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False
+)
+
+# 并发发送webhook的最大线程数
+_MAX_WORKERS = 8
+
+# 行尾空白（不含换行符）
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+
+# 两个及以上连续空行
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_text(text: str) -> str:
+    """规整消息文本，结果按原文缓存，重复发送相同消息时直接复用
+    
+    Args:
+        text: 需要处理的原始文本
+    
+    Returns:
+        str: 规整后的文本
+    """
+    # 转换转义字符（没有反斜杠时跳过）
+    if '\\' in text:
+        text = text.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r')
+    
+    # 去除行尾空白，合并连续空行
+    text = _TRAILING_WS_RE.sub('', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
+    
+    return text.strip()
+
+
+class NotificationError(Exception):
+    """通知发送相关错误"""
+    pass
+
+
+class _BaseNotifier:
+    """通知器公共逻辑：参数校验、请求体构造、响应检查和消息格式化"""
+    
+    def __init__(self, webhooks: Sequence[str], timeout: int = 10):
+        """初始化通知器
+        
+        Args:
+            webhooks: 飞书webhook地址列表
+            timeout: 请求超时时间（秒）
+        
+        Raises:
+            ValueError: webhook列表为空或超时时间无效时抛出
+        """
+        if not webhooks:
+            raise ValueError("webhook列表不能为空")
+        if timeout <= 0:
+            raise ValueError("超时时间必须大于0")
+        
+        self.webhooks = tuple(webhooks)
+        self.timeout = timeout
+        # 请求体始终是UTF-8编码的JSON，所有请求共用同一组请求头
+        self.headers = {"Content-Type": "application/json; charset=utf-8"}
+    
+    def _text_payload(self, text: str) -> Dict[str, Any]:
+        """构造文本消息请求体
+        
+        Raises:
+            ValueError: 消息内容为空时抛出
+        """
+        if not text or text.isspace():
+            raise ValueError("消息内容不能为空")
+        
+        return {
+            "msg_type": "text",
+            "content": {
+                "text": self._format_message(text)
+            }
+        }
+    
+    def _markdown_payload(self, text: str) -> Dict[str, Any]:
+        """构造Markdown消息请求体（消息卡片的markdown元素）
+        
+        Raises:
+            ValueError: 消息内容为空时抛出
+        """
+        if not text or text.isspace():
+            raise ValueError("消息内容不能为空")
+        
+        return {
+            "msg_type": "interactive",
+            "card": {
+                "elements": [
+                    {
+                        "tag": "markdown",
+                        "content": self._format_message(text)
+                    }
+                ]
+            }
+        }
+    
+    def _rich_text_payload(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """构造富文本消息请求体
+        
+        Raises:
+            ValueError: 消息内容为空时抛出
+        """
+        if not content:
+            raise ValueError("消息内容不能为空")
+        
+        return {
+            "msg_type": "post",
+            "content": {
+                "post": content
+            }
+        }
+    
+    def _finish(self, errors: List[str]) -> bool:
+        """汇总各webhook的发送结果
+        
+        Args:
+            errors: 按webhook顺序收集的错误信息
+        
+        Returns:
+            bool: 全部发送成功时返回True
+        
+        Raises:
+            NotificationError: 任一webhook发送失败时抛出
+        """
+        if not errors:
+            logger.info("消息发送成功")
+            return True
+        
+        if len(errors) == len(self.webhooks):
+            raise NotificationError("; ".join(errors))
+        
+        raise NotificationError(
+            f"部分webhook发送失败 ({len(errors)}/{len(self.webhooks)}): {'; '.join(errors)}"
+        )
+    
+    def _check_response(self, masked: str, status_code: int, content: bytes) -> None:
+        """检查单个webhook的响应
+        
+        Args:
+            masked: 脱敏后的webhook地址
+            status_code: HTTP状态码
+            content: 响应体
+        
+        Raises:
+            NotificationError: 请求失败或飞书API返回错误时抛出
+        """
+        # 解码为文本仅在DEBUG日志输出或出错时进行
+        logger.opt(lazy=True).debug(
+            "webhook响应: {} status={} body={}",
+            lambda: masked, lambda: status_code, lambda: content.decode('utf-8', 'replace')
+        )
+        
+        if status_code != 200:
+            raise NotificationError(f"HTTP请求失败: {status_code} {content.decode('utf-8', 'replace')}")
+        
+        try:
+            result = _loads(content)
+        except ValueError:
+            raise NotificationError(f"响应解析失败: {content.decode('utf-8', 'replace')}")
+        
+        if not isinstance(result, dict):
+            raise NotificationError(f"响应格式错误: {content.decode('utf-8', 'replace')}")
+        
+        code = result.get("code", result.get("StatusCode", 0))
+        if code != 0:
+            raise NotificationError(f"飞书API返回错误: {result.get('msg', result.get('StatusMessage'))} (code={code})")
+        
+        logger.debug("webhook发送成功: {}", masked)
+    
+    def _format_message(self, text: Optional[str]) -> Optional[str]:
+        """格式化消息文本
+        
+        - 将 \\n、\\t、\\r 转义字符转换为实际字符
+        - 去除每行行尾空白
+        - 合并连续空行，去除首尾空白
+        
+        Args:
+            text: 原始文本
+        
+        Returns:
+            Optional[str]: 格式化后的文本
+        """
+        if not text:
+            return text
+        
+        # 已经规整的文本（无转义字符、无首尾及行尾空白、无连续空行）原样返回
+        if (
+            '\\' not in text and
+            '\n\n\n' not in text and
+            text == text.strip() and
+            _TRAILING_WS_RE.search(text) is None
+        ):
+            return text
+        
+        return _normalize_text(text)
+
+
+class FeishuNotifier(_BaseNotifier):
+    """飞书通知器
+    
+    通过飞书自定义机器人的webhook发送消息。多个webhook并发发送，所有请求
+    共用一个 ``requests.Session``，发送到同一飞书域名时复用TCP/TLS连接。
+    """
+    
+    def __init__(self, webhooks: Sequence[str], timeout: int = 10):
+        """初始化通知器
+        
+        Args:
+            webhooks: 飞书webhook地址列表
+            timeout: 请求超时时间（秒）
+        
+        Raises:
+            ValueError: webhook列表为空或超时时间无效时抛出
+        """
+        super().__init__(webhooks, timeout)
+        
+        # 共享会话：连接池复用连接，由urllib3负责重试临时性故障
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=len(self.webhooks),
+            pool_maxsize=max(10, len(self.webhooks)),
+            max_retries=_RETRY
+        )
+        self._session.mount("https://", adapter)
+        
+        # 发送线程池在首次并发发送时创建，之后的发送复用；
+        # 通知器可能被多个线程同时使用，创建和关闭线程池时加锁
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """关闭会话和线程池，释放连接"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        self._session.close()
+    
+    def __enter__(self) -> "FeishuNotifier":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def send_text(self, text: str) -> bool:
+        """发送文本消息
+        
+        Args:
+            text: 消息内容，支持 \\n、\\t 等转义字符
+        
+        Returns:
+            bool: 发送是否成功
+        
+        Raises:
+            ValueError: 消息内容为空时抛出
+            NotificationError: 发送失败时抛出
+        """
+        return self._send_to_webhooks(self._text_payload(text))
+    
+    def send_markdown(self, text: str) -> bool:
+        """发送Markdown消息（以消息卡片的markdown元素发送）
+        
+        Args:
+            text: Markdown格式的消息内容
+        
+        Returns:
+            bool: 发送是否成功
+        
+        Raises:
+            ValueError: 消息内容为空时抛出
+            NotificationError: 发送失败时抛出
+        """
+        return self._send_to_webhooks(self._markdown_payload(text))
+    
+    def send_rich_text(self, content: Dict[str, Any]) -> bool:
+        """发送富文本消息
+        
+        Args:
+            content: 富文本内容，格式参见飞书post消息
+        
+        Returns:
+            bool: 发送是否成功
+        
+        Raises:
+            ValueError: 消息内容为空或无法序列化为JSON时抛出
+            NotificationError: 发送失败时抛出
+        """
+        return self._send_to_webhooks(self._rich_text_payload(content))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """获取发送线程池，首次调用时创建"""
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=min(len(self.webhooks), _MAX_WORKERS)
+                    )
+                executor = self._executor
+        return executor
+    
+    def _send_to_webhooks(self, payload: Dict[str, Any]) -> bool:
+        """发送消息到所有webhook
+        
+        Args:
+            payload: 请求体
+        
+        Returns:
+            bool: 全部发送成功时返回True
+        
+        Raises:
+            NotificationError: 任一webhook发送失败时抛出
+        """
+        logger.info(f"开始发送消息到 {len(self.webhooks)} 个webhook")
+        
+        # 请求体只序列化一次，所有webhook共用
+        body = _dumps(payload)
+        
+        # 只有一个webhook时直接在当前线程发送，不创建线程池
+        if len(self.webhooks) == 1:
+            try:
+                self._send_single_webhook(self.webhooks[0], body)
+            except NotificationError as e:
+                logger.error(f"webhook发送失败: {e}")
+                raise
+            return self._finish([])
+        
+        # 各webhook的请求互不依赖，并发发送，总耗时取决于最慢的一个
+        executor = self._get_executor()
+        futures = [
+            executor.submit(self._send_single_webhook, webhook, body)
+            for webhook in self.webhooks
+        ]
+        
+        # 按webhook顺序汇总结果，保证错误信息顺序稳定
+        errors: List[str] = []
+        for future in futures:
+            try:
+                future.result()
+            except NotificationError as e:
+                logger.error(f"webhook发送失败: {e}")
+                errors.append(str(e))
+        
+        return self._finish(errors)
+    
+    def _send_single_webhook(self, webhook: str, body: bytes) -> None:
+        """发送消息到单个webhook
+        
+        Args:
+            webhook: webhook地址
+            body: 已序列化的JSON请求体
+        
+        Raises:
+            NotificationError: 发送失败时抛出
+        """
+        masked = Config._mask_webhook(webhook)
+        
+        try:
+            response = self._session.post(webhook, data=body, timeout=self.timeout)
+        except requests.exceptions.Timeout:
+            raise NotificationError(f"请求超时: {masked}")
+        except requests.exceptions.ConnectionError:
+            raise NotificationError(f"网络连接失败: {masked}")
+        except requests.exceptions.RequestException as e:
+            raise NotificationError(f"请求失败: {masked}: {e}")
+        
+        # 响应体只读取一次
+        self._check_response(masked, response.status_code, response.content)
+
+
+class AsyncFeishuNotifier(_BaseNotifier):
+    """异步飞书通知器
+    
+    基于 ``httpx.AsyncClient``，在同一个事件循环中并发发送到所有webhook，
+    不占用额外线程，适合webhook较多或在异步程序中调用的场景。需要安装async
+    可选依赖（``pip install smallfeishu[async]``，包含httpx和h2），安装h2时使用HTTP/2。
+    """
+    
+    def __init__(self, webhooks: Sequence[str], timeout: int = 10):
+        """初始化通知器
+        
+        Args:
+            webhooks: 飞书webhook地址列表
+            timeout: 请求超时时间（秒）
+        
+        Raises:
+            ImportError: 未安装httpx时抛出
+            ValueError: webhook列表为空或超时时间无效时抛出
+        """
+        if httpx is None:
+            raise ImportError("异步通知器需要安装httpx: pip install smallfeishu[async]")
+        super().__init__(webhooks, timeout)
+        
+        # 共享客户端：复用连接，仅在建立连接失败时重试。飞书webhook同属一个域名，
+        # 安装了h2时启用HTTP/2，所有请求复用同一个连接
+        http2 = importlib.util.find_spec("h2") is not None
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(http2=http2, retries=2)
+        )
+    
+    async def aclose(self) -> None:
+        """关闭客户端，释放连接"""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "AsyncFeishuNotifier":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def send_text(self, text: str) -> bool:
+        """发送文本消息
+        
+        Args:
+            text: 消息内容，支持 \\n、\\t 等转义字符
+        
+        Returns:
+            bool: 发送是否成功
+        
+        Raises:
+            ValueError: 消息内容为空时抛出
+            NotificationError: 发送失败时抛出
+        """
+        return await self._send_to_webhooks(self._text_payload(text))
+    
+    async def send_markdown(self, text: str) -> bool:
+        """发送Markdown消息（以消息卡片的markdown元素发送）
+        
+        Args:
+            text: Markdown格式的消息内容
+        
+        Returns:
+            bool: 发送是否成功
+        
+        Raises:
+            ValueError: 消息内容为空时抛出
+            NotificationError: 发送失败时抛出
+        """
+        return await self._send_to_webhooks(self._markdown_payload(text))
+    
+    async def send_rich_text(self, content: Dict[str, Any]) -> bool:
+        """发送富文本消息
+        
+        Args:
+            content: 富文本内容，格式参见飞书post消息
+        
+        Returns:
+            bool: 发送是否成功
+        
+        Raises:
+            ValueError: 消息内容为空或无法序列化为JSON时抛出
+            NotificationError: 发送失败时抛出
+        """
+        return await self._send_to_webhooks(self._rich_text_payload(content))
+    
+    async def _send_to_webhooks(self, payload: Dict[str, Any]) -> bool:
+        """发送消息到所有webhook
+        
+        Args:
+            payload: 请求体
+        
+        Returns:
+            bool: 全部发送成功时返回True
+        
+        Raises:
+            NotificationError: 任一webhook发送失败时抛出
+        """
+        logger.info(f"开始发送消息到 {len(self.webhooks)} 个webhook")
+        
+        body = _dumps(payload)
+        results = await asyncio.gather(
+            *(self._send_single_webhook(webhook, body) for webhook in self.webhooks),
+            return_exceptions=True
+        )
+        
+        # gather按webhook顺序返回结果，非通知错误直接向上抛出
+        errors: List[str] = []
+        for result in results:
+            if isinstance(result, NotificationError):
+                logger.error(f"webhook发送失败: {result}")
+                errors.append(str(result))
+            elif isinstance(result, BaseException):
+                raise result
+        
+        return self._finish(errors)
+    
+    async def _send_single_webhook(self, webhook: str, body: bytes) -> None:
+        """发送消息到单个webhook
+        
+        Args:
+            webhook: webhook地址
+            body: 已序列化的JSON请求体
+        
+        Raises:
+            NotificationError: 发送失败时抛出
+        """
+        masked = Config._mask_webhook(webhook)
+        
+        try:
+            response = await self._client.post(webhook, content=body)
+        except httpx.TimeoutException:
+            raise NotificationError(f"请求超时: {masked}")
+        except httpx.TransportError:
+            raise NotificationError(f"网络连接失败: {masked}")
+        except httpx.HTTPError as e:
+            raise NotificationError(f"请求失败: {masked}: {e}")
+        
+        self._check_response(masked, response.status_code, response.content)
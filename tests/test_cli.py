@@ -8,10 +8,14 @@
 - 日志输出
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
-from feishu.cli import FeishuCLI
+from feishu.cli import FeishuCLI, _parse_args
 from feishu.config import ConfigError
 from feishu.notification import NotificationError
 
@@ -24,17 +28,18 @@ class TestFeishuCLI:
         self.cli = FeishuCLI()
     
     @patch('feishu.cli.Config.load')
-    @patch('feishu.cli.FeishuNotifier')
+    @patch('feishu.notification.FeishuNotifier')
     def test_send_text_success(self, mock_notifier_class, mock_config_load):
         """测试成功发送文本消息"""
         # 模拟配置
         mock_config = Mock()
         mock_config.is_enabled.return_value = True
-        mock_config.get_webhooks.return_value = ["https://test.webhook.url"]
+        mock_config.get_webhooks.return_value = ("https://test.webhook.url",)
         mock_config_load.return_value = mock_config
         
         # 模拟通知器
-        mock_notifier = Mock()
+        mock_notifier = MagicMock()
+        mock_notifier.__enter__.return_value = mock_notifier
         mock_notifier.send_text.return_value = True
         mock_notifier_class.return_value = mock_notifier
         
@@ -44,8 +49,10 @@ class TestFeishuCLI:
         # 验证结果
         assert result is True
         mock_config_load.assert_called_once_with(None)
-        mock_notifier_class.assert_called_once_with(["https://test.webhook.url"])
+        mock_notifier_class.assert_called_once_with(("https://test.webhook.url",))
         mock_notifier.send_text.assert_called_once_with("测试消息")
+        # 发送结束后关闭通知器
+        mock_notifier.__exit__.assert_called_once()
     
     @patch('feishu.cli.Config.load')
     def test_send_text_feishu_disabled(self, mock_config_load):
@@ -68,35 +75,41 @@ class TestFeishuCLI:
             self.cli.send("测试消息")
     
     @patch('feishu.cli.Config.load')
-    @patch('feishu.cli.FeishuNotifier')
+    @patch('feishu.notification.FeishuNotifier')
     def test_send_text_notification_error(self, mock_notifier_class, mock_config_load):
         """测试通知发送错误"""
         # 模拟配置
         mock_config = Mock()
         mock_config.is_enabled.return_value = True
-        mock_config.get_webhooks.return_value = ["https://test.webhook.url"]
+        mock_config.get_webhooks.return_value = ("https://test.webhook.url",)
         mock_config_load.return_value = mock_config
         
         # 模拟通知器错误
-        mock_notifier = Mock()
+        mock_notifier = MagicMock()
+        mock_notifier.__enter__.return_value = mock_notifier
         mock_notifier.send_text.side_effect = NotificationError("发送失败")
         mock_notifier_class.return_value = mock_notifier
         
         with pytest.raises(SystemExit):
             self.cli.send("测试消息")
+        
+        # 发送失败退出时同样关闭通知器
+        mock_notifier.send_text.assert_called_once_with("测试消息")
+        mock_notifier.__exit__.assert_called_once()
     
     @patch('feishu.cli.Config.load')
-    @patch('feishu.cli.FeishuNotifier')
+    @patch('feishu.notification.FeishuNotifier')
     def test_send_with_custom_config(self, mock_notifier_class, mock_config_load):
         """测试使用自定义配置文件"""
         # 模拟配置
         mock_config = Mock()
         mock_config.is_enabled.return_value = True
-        mock_config.get_webhooks.return_value = ["https://test.webhook.url"]
+        mock_config.get_webhooks.return_value = ("https://test.webhook.url",)
         mock_config_load.return_value = mock_config
         
         # 模拟通知器
-        mock_notifier = Mock()
+        mock_notifier = MagicMock()
+        mock_notifier.__enter__.return_value = mock_notifier
         mock_notifier.send_text.return_value = True
         mock_notifier_class.return_value = mock_notifier
         
@@ -107,6 +120,20 @@ class TestFeishuCLI:
         mock_config_load.assert_called_once_with("/custom/config.toml")
         assert result is True
     
+    @patch('feishu.cli.Config.load')
+    @patch('feishu.notification.FeishuNotifier')
+    def test_send_no_webhooks(self, mock_notifier_class, mock_config_load):
+        """测试启用飞书但没有webhook时不创建通知器"""
+        mock_config = Mock()
+        mock_config.is_enabled.return_value = True
+        mock_config.get_webhooks.return_value = ()
+        mock_config_load.return_value = mock_config
+        
+        with pytest.raises(SystemExit):
+            self.cli.send("测试消息")
+        
+        mock_notifier_class.assert_not_called()
+    
     def test_send_empty_message(self):
         """测试发送空消息"""
         with pytest.raises(SystemExit):
@@ -152,17 +179,18 @@ class TestFeishuCLI:
             self.cli.status()
     
     @patch('feishu.cli.Config.load')
-    @patch('feishu.cli.FeishuNotifier')
+    @patch('feishu.notification.FeishuNotifier')
     def test_test_command_success(self, mock_notifier_class, mock_config_load):
         """测试test命令成功"""
         # 模拟配置
         mock_config = Mock()
         mock_config.is_enabled.return_value = True
-        mock_config.get_webhooks.return_value = ["https://test.webhook.url"]
+        mock_config.get_webhooks.return_value = ("https://test.webhook.url",)
         mock_config_load.return_value = mock_config
         
         # 模拟通知器
-        mock_notifier = Mock()
+        mock_notifier = MagicMock()
+        mock_notifier.__enter__.return_value = mock_notifier
         mock_notifier.send_text.return_value = True
         mock_notifier_class.return_value = mock_notifier
         
@@ -173,6 +201,7 @@ class TestFeishuCLI:
         mock_notifier.send_text.assert_called_once()
         call_args = mock_notifier.send_text.call_args[0][0]
         assert "测试消息" in call_args
+        mock_notifier.__exit__.assert_called_once()
     
     @patch('feishu.cli.Config.load')
     def test_test_command_feishu_disabled(self, mock_config_load):
@@ -211,4 +240,40 @@ class TestFeishuCLI:
             
             # 验证错误被记录并退出
             mock_logger.error.assert_called()
-            mock_exit.assert_called_with(1)
\ No newline at end of file
+            mock_exit.assert_called_with(1)
+    
+    def test_parse_send_args(self):
+        """测试解析send命令参数"""
+        name, kwargs = _parse_args(["send", "**粗体**", "--type", "markdown", "--config", "/custom/config.toml"])
+        
+        assert name == "send"
+        assert kwargs == {
+            "message": "**粗体**",
+            "message_type": "markdown",
+            "file": None,
+            "config": "/custom/config.toml",
+        }
+    
+    def test_parse_config_args(self):
+        """测试解析config命令参数"""
+        assert _parse_args(["config"]) == ("config", {"action": "show"})
+        assert _parse_args(["config", "path"]) == ("config", {"action": "path"})
+        assert _parse_args(["status"]) == ("status", {})
+    
+    def test_parse_unknown_command(self):
+        """测试未知命令"""
+        with pytest.raises(SystemExit):
+            _parse_args(["unknown"])
+    
+    def test_import_does_not_load_heavy_modules(self):
+        """测试导入CLI时不加载requests和TOML解析器"""
+        code = (
+            "import sys, feishu.cli; "
+            "print(sorted(m for m in ('requests', 'tomllib', 'tomli') if m in sys.modules))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        )
+        
+        assert result.stdout.strip() == "[]"
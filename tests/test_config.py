@@ -7,10 +7,12 @@
 - 错误处理
 """
 
+import json
 import os
 import tempfile
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from feishu.config import Config, ConfigError
 
@@ -18,6 +20,15 @@ from feishu.config import Config, ConfigError
 class TestConfig:
     """配置模块测试类"""
     
+    @pytest.fixture(autouse=True)
+    def isolate_cache(self, tmp_path):
+        """每个测试使用独立的编译缓存文件，并清空进程内缓存，不读写用户目录"""
+        self.cache_path = tmp_path / "cache" / "config.json"
+        with patch('feishu.config._CACHE_PATH', self.cache_path):
+            Config.clear_cache()
+            yield
+        Config.clear_cache()
+    
     def test_load_valid_config(self):
         """测试加载有效配置文件"""
         config_content = """
@@ -35,6 +46,7 @@ webhooks = ["https://open.feishu.cn/open-apis/bot/v2/hook/test-token"]
             assert config.feishu_enabled is True
             assert len(config.webhooks) == 1
             assert "test-token" in config.webhooks[0]
+            assert config.get_webhooks() is config.webhooks
         finally:
             os.unlink(config_path)
     
@@ -133,6 +145,39 @@ webhooks = ["invalid-url"]
         finally:
             os.unlink(config_path)
     
+    def test_skip_webhook_validation_when_disabled(self):
+        """测试禁用飞书时不校验webhook URL"""
+        config_content = """
+[notifications.feishu]
+enabled = false
+webhooks = ["invalid-url"]
+        """
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
+            f.write(config_content)
+            config_path = f.name
+        
+        try:
+            config = Config.load(config_path)
+            assert config.feishu_enabled is False
+            assert config.webhooks == ("invalid-url",)
+        finally:
+            os.unlink(config_path)
+    
+    def test_is_valid_webhook_url(self):
+        """测试webhook URL格式校验"""
+        assert Config._is_valid_webhook_url("https://open.feishu.cn/open-apis/bot/v2/hook/test-token")
+        assert not Config._is_valid_webhook_url("http://open.feishu.cn/open-apis/bot/v2/hook/test-token")
+        assert not Config._is_valid_webhook_url("https://open.feishu.cn.evil.com/open-apis/bot/v2/hook/test-token")
+        assert not Config._is_valid_webhook_url("https://evilfeishu.cn.attacker.tld/open-apis/bot/v2/hook/test-token")
+        assert not Config._is_valid_webhook_url("https://evil.com\\.feishu.cn/open-apis/bot/v2/hook/x")
+        assert not Config._is_valid_webhook_url("https://user@open.feishu.cn/open-apis/bot/v2/hook/x")
+        assert not Config._is_valid_webhook_url("https://open.feishu.cn/open-apis/bot/v2/hook/x\n")
+        assert not Config._is_valid_webhook_url("https://open.feishu.cn/proxy/open-apis/bot/v2/hook/test-token")
+        assert not Config._is_valid_webhook_url("https://open.feishu.cn/open-apis/bot/v2/hook/")
+        assert not Config._is_valid_webhook_url(None)
+        assert not Config._is_valid_webhook_url("https://open.feishu.cn/open-apis/bot/v2/hook/" + "a" * 512)
+    
     def test_load_default_config_path(self):
         """测试加载默认配置文件路径"""
         # 创建临时目录和配置文件
@@ -149,8 +194,90 @@ webhooks = ["https://open.feishu.cn/open-apis/bot/v2/hook/test-token"]
             original_cwd = os.getcwd()
             try:
                 os.chdir(temp_dir)
+                Config.clear_cache()
                 config = Config.load()
                 assert config.feishu_enabled is True
                 assert len(config.webhooks) == 1
             finally:
-                os.chdir(original_cwd)
\ No newline at end of file
+                os.chdir(original_cwd)
+                Config.clear_cache()
+    
+    def test_load_uses_cache_when_file_unchanged(self):
+        """测试配置文件未变化时使用缓存"""
+        config_content = """
+[feishu]
+enabled = true
+webhooks = ["https://open.feishu.cn/open-apis/bot/v2/hook/test-token"]
+        """
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.toml"
+            config_path.write_text(config_content)
+            
+            Config.load(str(config_path))
+            assert self.cache_path.exists()
+            
+            # 清空进程内缓存，命中文件缓存时不应再读取和解析TOML
+            Config.clear_cache()
+            with patch.object(Config, 'parse', side_effect=AssertionError("不应解析配置文件")) as mock_parse:
+                config = Config.load(str(config_path))
+            
+            mock_parse.assert_not_called()
+            assert config.feishu_enabled is True
+            assert config.webhooks == ("https://open.feishu.cn/open-apis/bot/v2/hook/test-token",)
+    
+    def test_load_ignores_tampered_cache(self):
+        """测试缓存内容未通过验证时忽略缓存，重新解析配置文件"""
+        config_content = """
+[feishu]
+enabled = true
+webhooks = ["https://open.feishu.cn/open-apis/bot/v2/hook/test-token"]
+        """
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.toml"
+            config_path.write_text(config_content)
+            
+            Config.load(str(config_path))
+            path, mtime_ns, size, _, _ = json.loads(self.cache_path.read_text())
+            self.cache_path.write_text(json.dumps([path, mtime_ns, size, True, ["https://evil.com/hook"]]))
+            
+            Config.clear_cache()
+            config = Config.load(str(config_path))
+            
+            assert config.webhooks == ("https://open.feishu.cn/open-apis/bot/v2/hook/test-token",)
+    
+    def test_parse_bypasses_cache(self):
+        """测试直接解析不读写缓存"""
+        config_content = """
+[feishu]
+enabled = false
+webhooks = []
+        """
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.toml"
+            config_path.write_text(config_content)
+            
+            first = Config.parse(str(config_path))
+            second = Config.parse(str(config_path))
+            
+            assert first is not second
+            assert first.feishu_enabled is False
+            assert not self.cache_path.exists()
+    
+    def test_load_returns_same_instance_in_process(self):
+        """测试同一进程内重复加载返回同一配置对象"""
+        config_content = """
+[feishu]
+enabled = false
+webhooks = []
+        """
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.toml"
+            config_path.write_text(config_content)
+            
+            first = Config.load(str(config_path))
+            second = Config.load(str(config_path))
+            assert first is second
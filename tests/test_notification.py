@@ -7,11 +7,36 @@
 - 消息格式化
 """
 
+import asyncio
+import importlib.util
+import json
+import sys
+import threading
+import time
 import pytest
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 from requests.exceptions import Timeout, ConnectionError
 
-from feishu.notification import FeishuNotifier, NotificationError
+from feishu import notification
+from feishu.notification import AsyncFeishuNotifier, FeishuNotifier, NotificationError, _normalize_text
+
+
+def _response(status_code=200, content=b'{"code": 0, "msg": "success"}'):
+    """构造模拟的webhook响应（只含通知器读取的状态码和响应体）"""
+    return SimpleNamespace(status_code=status_code, content=content)
+
+
+# 常用响应只读不改，导入时构造一次，各测试共用
+_OK_RESPONSE = _response()
+_API_ERROR_RESPONSE = _response(200, b'{"code": 9999, "msg": "invalid webhook"}')
+_HTTP_400_RESPONSE = _response(400, b"Bad Request")
+
+_WEBHOOKS = [
+    "https://open.feishu.cn/open-apis/bot/v2/hook/test-token-1",
+    "https://open.feishu.cn/open-apis/bot/v2/hook/test-token-2"
+]
 
 
 class TestFeishuNotifier:
@@ -19,27 +44,25 @@ class TestFeishuNotifier:
     
     def setup_method(self):
         """测试方法设置"""
-        self.webhooks = [
-            "https://open.feishu.cn/open-apis/bot/v2/hook/test-token-1",
-            "https://open.feishu.cn/open-apis/bot/v2/hook/test-token-2"
-        ]
+        self.webhooks = _WEBHOOKS
         self.notifier = FeishuNotifier(self.webhooks)
+        
+        # 所有请求都经过共享会话的post方法，默认返回成功响应
+        self.post_patcher = patch('feishu.notification.requests.Session.post', return_value=_OK_RESPONSE)
+        self.mock_post = self.post_patcher.start()
+    
+    def teardown_method(self):
+        """测试方法清理"""
+        # 关闭通知器，释放并发发送时创建的线程池
+        self.notifier.close()
+        self.post_patcher.stop()
     
-    @patch('feishu.notification.requests.post')
-    def test_send_text_message_success(self, mock_post):
+    def test_send_text_message_success(self):
         """测试成功发送文本消息"""
-        # 模拟成功响应
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"code": 0, "msg": "success"}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.text = '{"code": 0, "msg": "success"}'
-        mock_post.return_value = mock_response
-        
         result = self.notifier.send_text("测试消息")
         
         assert result is True
-        assert mock_post.call_count == 2  # 两个webhook都应该被调用
+        assert self.mock_post.call_count == 2  # 两个webhook都应该被调用
         
         # 验证请求参数
         expected_payload = {
@@ -49,100 +72,43 @@ class TestFeishuNotifier:
             }
         }
         
-        for call in mock_post.call_args_list:
+        for call in self.mock_post.call_args_list:
             args, kwargs = call
-            assert kwargs['json'] == expected_payload
+            assert json.loads(kwargs['data']) == expected_payload
             assert kwargs['timeout'] == 10
-            assert 'headers' in kwargs
+        
+        # 请求头设置在共享会话上
+        assert self.notifier._session.headers['Content-Type'] == "application/json; charset=utf-8"
     
-    @patch('feishu.notification.requests.post')
-    def test_send_text_message_with_custom_timeout(self, mock_post):
+    def test_send_text_message_with_custom_timeout(self):
         """测试使用自定义超时时间发送消息"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"code": 0, "msg": "success"}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.text = '{"code": 0, "msg": "success"}'
-        mock_post.return_value = mock_response
-        
-        notifier = FeishuNotifier(self.webhooks, timeout=30)
-        result = notifier.send_text("测试消息")
+        with FeishuNotifier(self.webhooks, timeout=30) as notifier:
+            result = notifier.send_text("测试消息")
         
         assert result is True
         # 验证超时参数
-        for call in mock_post.call_args_list:
+        for call in self.mock_post.call_args_list:
             args, kwargs = call
             assert kwargs['timeout'] == 30
     
-    @patch('feishu.notification.requests.post')
-    def test_send_text_message_api_error(self, mock_post):
-        """测试API返回错误"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"code": 9999, "msg": "invalid webhook"}
-        mock_post.return_value = mock_response
-        
-        with pytest.raises(NotificationError, match="飞书API返回错误"):
-            self.notifier.send_text("测试消息")
-    
-    @patch('feishu.notification.requests.post')
-    def test_send_text_message_http_error(self, mock_post):
-        """测试HTTP错误"""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_post.return_value = mock_response
-        
-        with pytest.raises(NotificationError, match="HTTP请求失败"):
-            self.notifier.send_text("测试消息")
-    
-    @patch('feishu.notification.requests.post')
-    def test_send_text_message_timeout(self, mock_post):
-        """测试请求超时"""
-        mock_post.side_effect = Timeout("Request timeout")
-        
-        with pytest.raises(NotificationError, match="请求超时"):
-            self.notifier.send_text("测试消息")
-    
-    @patch('feishu.notification.requests.post')
-    def test_send_text_message_connection_error(self, mock_post):
-        """测试连接错误"""
-        mock_post.side_effect = ConnectionError("Connection failed")
-        
-        with pytest.raises(NotificationError, match="网络连接失败"):
-            self.notifier.send_text("测试消息")
-    
-    @patch('feishu.notification.requests.post')
-    def test_send_text_message_partial_failure(self, mock_post):
-        """测试部分webhook失败的情况"""
+    @pytest.mark.parametrize("side_effect, expected", [
+        ([_API_ERROR_RESPONSE] * 2, "飞书API返回错误"),
+        ([_HTTP_400_RESPONSE] * 2, "HTTP请求失败"),
+        ([_response(200, b'[1]')] * 2, "响应格式错误"),
+        (Timeout("Request timeout"), "请求超时"),
+        (ConnectionError("Connection failed"), "网络连接失败"),
         # 第一个webhook成功，第二个失败
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.json.return_value = {"code": 0, "msg": "success"}
-        success_response.headers = {"Content-Type": "application/json"}
-        success_response.text = '{"code": 0, "msg": "success"}'
+        ([_OK_RESPONSE, _HTTP_400_RESPONSE], "部分webhook发送失败"),
+    ], ids=["api_error", "http_error", "non_object_json", "timeout", "connection_error", "partial_failure"])
+    def test_send_text_message_errors(self, side_effect, expected):
+        """测试API错误、HTTP错误、超时、连接错误和部分失败"""
+        self.mock_post.side_effect = side_effect
         
-        failure_response = Mock()
-        failure_response.status_code = 400
-        failure_response.text = "Bad Request"
-        failure_response.headers = {"Content-Type": "text/plain"}
-        
-        responses = [success_response, failure_response]
-        mock_post.side_effect = responses
-        
-        with pytest.raises(NotificationError, match="部分webhook发送失败"):
+        with pytest.raises(NotificationError, match=expected):
             self.notifier.send_text("测试消息")
     
-    @patch('feishu.notification.requests.post')
-    def test_send_rich_text_message(self, mock_post):
+    def test_send_rich_text_message(self):
         """测试发送富文本消息"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"code": 0, "msg": "success"}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.text = '{"code": 0, "msg": "success"}'
-        mock_post.return_value = mock_response
-        
         content = {
             "zh_cn": {
                 "title": "测试标题",
@@ -164,120 +130,137 @@ class TestFeishuNotifier:
             }
         }
         
-        for call in mock_post.call_args_list:
+        for call in self.mock_post.call_args_list:
             args, kwargs = call
-            assert kwargs['json'] == expected_payload
+            assert json.loads(kwargs['data']) == expected_payload
     
-    def test_empty_webhooks(self):
-        """测试空webhook列表"""
-        with pytest.raises(ValueError, match="webhook列表不能为空"):
-            FeishuNotifier([])
+    def test_session_reused_across_sends(self):
+        """测试多次发送复用同一会话和线程池"""
+        with FeishuNotifier(self.webhooks) as notifier:
+            session = notifier._session
+            notifier.send_text("第一条")
+            executor = notifier._executor
+            notifier.send_text("第二条")
+            assert notifier._session is session
+            assert notifier._executor is executor
+        
+        assert self.mock_post.call_count == 4
+        # 退出上下文时关闭线程池
+        assert notifier._executor is None
     
-    def test_invalid_timeout(self):
-        """测试无效的超时时间"""
-        with pytest.raises(ValueError, match="超时时间必须大于0"):
-            FeishuNotifier(self.webhooks, timeout=0)
+    def test_executor_created_once_across_threads(self):
+        """测试多个线程同时首次发送时只创建一个线程池"""
+        created = []
         
-        with pytest.raises(ValueError, match="超时时间必须大于0"):
-            FeishuNotifier(self.webhooks, timeout=-1)
+        def slow_executor(*args, **kwargs):
+            # 放大创建线程池的耗时，未加锁时并发发送会各自创建线程池
+            time.sleep(0.05)
+            executor = ThreadPoolExecutor(*args, **kwargs)
+            created.append(executor)
+            return executor
+        
+        with FeishuNotifier(self.webhooks) as notifier:
+            with patch('feishu.notification.ThreadPoolExecutor', side_effect=slow_executor):
+                threads = [threading.Thread(target=notifier.send_text, args=("测试消息",)) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        
+        assert len(created) == 1
+        assert self.mock_post.call_count == 8
+    
+    @patch('feishu.notification.ThreadPoolExecutor')
+    def test_single_webhook_skips_executor(self, mock_executor):
+        """测试只有一个webhook时直接发送，不创建线程池"""
+        notifier = FeishuNotifier(self.webhooks[:1])
+        assert notifier.send_text("测试消息") is True
+        assert self.mock_post.call_count == 1
+        mock_executor.assert_not_called()
+        
+        self.mock_post.side_effect = Timeout()
+        with pytest.raises(NotificationError, match="^请求超时"):
+            notifier.send_text("测试消息")
     
-    @patch('feishu.notification.requests.post')
-    def test_send_empty_message(self, mock_post):
+    def test_retry_policy(self):
+        """测试会话按重试策略处理POST请求的临时性故障"""
+        retry = self.notifier._session.get_adapter(self.webhooks[0]).max_retries
+        
+        assert "POST" in retry.allowed_methods
+        assert retry.connect == 2
+        assert retry.read == 0
+        assert retry.backoff_jitter > 0
+        assert retry.backoff_max == 30
+        assert retry.is_retry("POST", 503)
+        assert not retry.is_retry("POST", 500)
+    
+    def test_send_empty_message(self):
         """测试发送空消息"""
         with pytest.raises(ValueError, match="消息内容不能为空"):
             self.notifier.send_text("")
         
         with pytest.raises(ValueError, match="消息内容不能为空"):
             self.notifier.send_text(None)
+        
+        with pytest.raises(ValueError, match="消息内容不能为空"):
+            self.notifier.send_text("  \n\t ")
     
     @patch('feishu.notification.logger')
-    @patch('feishu.notification.requests.post')
-    def test_logging(self, mock_post, mock_logger):
+    def test_logging(self, mock_logger):
         """测试日志记录"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"code": 0, "msg": "success"}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.text = '{"code": 0, "msg": "success"}'
-        mock_post.return_value = mock_response
-        
         self.notifier.send_text("测试消息")
         
         # 验证日志调用
         assert mock_logger.info.called
         assert mock_logger.debug.called
     
-    def test_format_message_newlines(self):
-        """测试换行符处理"""
-        # 测试转义换行符转换
-        result = self.notifier._format_message("第一行\\n第二行\\n第三行")
-        expected = "第一行\n第二行\n第三行"
-        assert result == expected
-        
-        # 测试混合换行符（真实回车和转义字符）
-        result = self.notifier._format_message("第一行\\n\n第二行")
-        expected = "第一行\n\n第二行"
-        assert result == expected
-        
-        # 测试复杂混合场景：既有真实回车又有\n转义字符
-        mixed_input = "标题\\n\n内容1\\n内容2\n\\n结尾"
-        result = self.notifier._format_message(mixed_input)
-        expected = "标题\n\n内容1\n内容2\n\n结尾"
-        assert result == expected
-    
-    def test_format_message_tabs_and_carriage_returns(self):
-        """测试制表符和回车符处理"""
-        # 测试制表符
-        result = self.notifier._format_message("列1\\t列2\\t列3")
-        expected = "列1\t列2\t列3"
-        assert result == expected
-        
-        # 测试回车符
-        result = self.notifier._format_message("文本\\r换行")
-        expected = "文本\r换行"
-        assert result == expected
+    @pytest.mark.parametrize("text, expected", [
+        # 转义换行符转换
+        ("第一行\\n第二行\\n第三行", "第一行\n第二行\n第三行"),
+        # 混合换行符（真实回车和转义字符）
+        ("第一行\\n\n第二行", "第一行\n\n第二行"),
+        ("标题\\n\n内容1\\n内容2\n\\n结尾", "标题\n\n内容1\n内容2\n\n结尾"),
+        # 制表符和回车符
+        ("列1\\t列2\\t列3", "列1\t列2\t列3"),
+        ("文本\\r换行", "文本\r换行"),
+        # 去除行尾空格
+        ("第一行   \\n第二行\t\\n第三行", "第一行\n第二行\n第三行"),
+        # 合并连续空行，去除开头和结尾的空行
+        ("第一行\\n\\n\\n\\n第二行", "第一行\n\n第二行"),
+        ("\\n\\n第一行\\n第二行\\n\\n", "第一行\n第二行"),
+        # 复杂格式化场景
+        ("\\n\\n  标题  \\n\\n\\n内容第一行   \\n\\n内容第二行\\t\\n\\n\\n", "标题\n\n内容第一行\n\n内容第二行"),
+        # 空文本或None
+        ("", ""),
+        (None, None),
+        ("   ", ""),
+    ], ids=[
+        "newlines", "mixed_newlines", "mixed_complex", "tabs", "carriage_returns",
+        "trailing_spaces", "extra_empty_lines", "leading_trailing_empty_lines",
+        "complex", "empty", "none", "whitespace_only",
+    ])
+    def test_format_message(self, text, expected):
+        """测试消息格式化"""
+        assert self.notifier._format_message(text) == expected
     
-    def test_format_message_remove_trailing_spaces(self):
-        """测试去除行尾空格"""
-        result = self.notifier._format_message("第一行   \\n第二行\t\\n第三行")
-        expected = "第一行\n第二行\n第三行"
-        assert result == expected
+    def test_format_message_clean_text_unchanged(self):
+        """测试已规整的文本原样返回"""
+        text = "标题\n\n内容第一行\n  缩进内容"
+        assert self.notifier._format_message(text) is text
     
-    def test_format_message_remove_extra_empty_lines(self):
-        """测试去除多余空行"""
-        # 测试多个连续空行
-        result = self.notifier._format_message("第一行\\n\\n\\n\\n第二行")
-        expected = "第一行\n\n第二行"
-        assert result == expected
-        
-        # 测试开头和结尾的空行
-        result = self.notifier._format_message("\\n\\n第一行\\n第二行\\n\\n")
-        expected = "第一行\n第二行"
-        assert result == expected
-    
-    def test_format_message_complex_case(self):
-        """测试复杂格式化场景"""
-        input_text = "\\n\\n  标题  \\n\\n\\n内容第一行   \\n\\n内容第二行\\t\\n\\n\\n"
-        result = self.notifier._format_message(input_text)
-        expected = "标题\n\n内容第一行\n\n内容第二行"
-        assert result == expected
-    
-    def test_format_message_empty_or_none(self):
-        """测试空文本或None"""
-        assert self.notifier._format_message("") == ""
-        assert self.notifier._format_message(None) is None
-        assert self.notifier._format_message("   ") == ""
+    def test_format_message_cached(self):
+        """测试相同的待处理文本只格式化一次"""
+        _normalize_text.cache_clear()
+        
+        first = self.notifier._format_message("重复消息\\n第二行  ")
+        second = self.notifier._format_message("重复消息\\n第二行  ")
+        
+        assert first == second == "重复消息\n第二行"
+        info = _normalize_text.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
     
-    @patch('feishu.notification.requests.post')
-    def test_send_text_with_formatting(self, mock_post):
+    def test_send_text_with_formatting(self):
         """测试发送带格式化的文本消息"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"code": 0, "msg": "success"}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.text = '{"code": 0, "msg": "success"}'
-        mock_post.return_value = mock_response
-        
         # 发送包含转义换行符的消息
         original_text = "测试消息\\n第二行\\n\\n第三行"
         result = self.notifier.send_text(original_text)
@@ -293,6 +276,182 @@ class TestFeishuNotifier:
             }
         }
         
-        for call in mock_post.call_args_list:
+        for call in self.mock_post.call_args_list:
+            args, kwargs = call
+            assert json.loads(kwargs['data']) == expected_payload
+
+
+class TestFeishuNotifierConstruction:
+    """飞书通知器参数校验测试类（只测试构造函数，无需预先创建通知器）"""
+    
+    def test_empty_webhooks(self):
+        """测试空webhook列表"""
+        with pytest.raises(ValueError, match="webhook列表不能为空"):
+            FeishuNotifier([])
+    
+    def test_invalid_timeout(self):
+        """测试无效的超时时间"""
+        with pytest.raises(ValueError, match="超时时间必须大于0"):
+            FeishuNotifier(_WEBHOOKS, timeout=0)
+        
+        with pytest.raises(ValueError, match="超时时间必须大于0"):
+            FeishuNotifier(_WEBHOOKS, timeout=-1)
+
+
+class TestJsonCodec:
+    """请求体编解码测试类（orjson与标准库两条路径）"""
+    
+    def setup_method(self):
+        """以屏蔽orjson的方式另行加载一份模块，得到标准库实现"""
+        spec = importlib.util.spec_from_file_location(
+            "feishu._notification_stdlib", notification.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {'orjson': None}):
+            spec.loader.exec_module(module)
+        self.stdlib_dumps = module._dumps
+        self.stdlib_loads = module._loads
+    
+    @pytest.mark.parametrize("payload", [
+        {"msg_type": "text", "content": {"text": "中文\n\t\"引号\" \\ 😀"}},
+        {"msg_type": "post", "content": {"post": {"zh_cn": {"title": "标题", "content": [[{"tag": "text", "text": "a"}]]}}}},
+        {"list": [1, -2, True, False, None, ""], 1: "数字键", None: "空键"},
+    ], ids=["text", "rich_text", "non_str_keys"])
+    def test_dumps_matches_stdlib(self, payload):
+        """测试两条路径输出相同的bytes，且都能解析回原内容"""
+        body = notification._dumps(payload)
+        
+        assert body == self.stdlib_dumps(payload)
+        assert notification._loads(body) == self.stdlib_loads(body)
+    
+    @pytest.mark.parametrize("payload", [
+        {"content": {1, 2}},
+        {"content": object()},
+    ], ids=["set", "object"])
+    def test_dumps_unserializable_raises_value_error(self, payload):
+        """测试两条路径对无法序列化的内容都抛出ValueError"""
+        with pytest.raises(ValueError, match="无法序列化为JSON"):
+            notification._dumps(payload)
+        with pytest.raises(ValueError, match="无法序列化为JSON"):
+            self.stdlib_dumps(payload)
+
+
+class _HTTPError(Exception):
+    pass
+
+
+class _TransportError(_HTTPError):
+    pass
+
+
+class _TimeoutException(_TransportError):
+    pass
+
+
+class TestAsyncFeishuNotifier:
+    """异步飞书通知器测试类（以替身代替httpx，无需安装）"""
+    
+    def setup_method(self):
+        """测试方法设置"""
+        self.webhooks = _WEBHOOKS
+        self.client = Mock()
+        self.client.post = AsyncMock(return_value=_OK_RESPONSE)
+        self.client.aclose = AsyncMock()
+        fake_httpx = Mock(
+            HTTPError=_HTTPError,
+            TransportError=_TransportError,
+            TimeoutException=_TimeoutException
+        )
+        fake_httpx.AsyncClient.return_value = self.client
+        self.httpx = fake_httpx
+        self.patcher = patch('feishu.notification.httpx', fake_httpx)
+        self.patcher.start()
+    
+    def teardown_method(self):
+        """测试方法清理"""
+        self.patcher.stop()
+    
+    def test_send_text_success(self):
+        """测试异步发送文本消息到所有webhook"""
+        notifier = AsyncFeishuNotifier(self.webhooks)
+        
+        result = asyncio.run(notifier.send_text("测试消息\\n第二行"))
+        
+        assert result is True
+        assert self.client.post.await_count == 2
+        for call, webhook in zip(self.client.post.call_args_list, self.webhooks):
             args, kwargs = call
-            assert kwargs['json'] == expected_payload
\ No newline at end of file
+            assert args == (webhook,)
+            assert json.loads(kwargs['content']) == {
+                "msg_type": "text",
+                "content": {"text": "测试消息\n第二行"}
+            }
+    
+    def test_http2_when_h2_installed(self):
+        """测试安装h2时启用HTTP/2，否则使用HTTP/1.1"""
+        with patch('feishu.notification.importlib.util.find_spec', return_value=Mock()):
+            AsyncFeishuNotifier(self.webhooks)
+        with patch('feishu.notification.importlib.util.find_spec', return_value=None):
+            AsyncFeishuNotifier(self.webhooks)
+        
+        transport = self.httpx.AsyncHTTPTransport
+        assert [call.kwargs['http2'] for call in transport.call_args_list] == [True, False]
+    
+    def test_send_partial_failure(self):
+        """测试部分webhook失败时按顺序汇总错误"""
+        self.client.post.side_effect = [_OK_RESPONSE, _TimeoutException()]
+        notifier = AsyncFeishuNotifier(self.webhooks)
+        
+        with pytest.raises(NotificationError, match=r"部分webhook发送失败 \(1/2\): 请求超时"):
+            asyncio.run(notifier.send_text("测试消息"))
+    
+    def test_context_manager_closes_client(self):
+        """测试异步上下文管理器退出时关闭客户端"""
+        async def run():
+            async with AsyncFeishuNotifier(self.webhooks) as notifier:
+                await notifier.send_markdown("**测试**")
+        
+        asyncio.run(run())
+        
+        self.client.aclose.assert_awaited_once()
+    
+    def test_requires_httpx(self):
+        """测试未安装httpx时抛出ImportError"""
+        with patch('feishu.notification.httpx', None):
+            with pytest.raises(ImportError, match="httpx"):
+                AsyncFeishuNotifier(self.webhooks)
+
+
+class TestAsyncFeishuNotifierWithHttpx:
+    """异步飞书通知器测试类（使用真实httpx，未安装时跳过）"""
+    
+    def test_send_with_real_httpx(self):
+        """测试真实httpx下的请求内容与异常映射"""
+        httpx = pytest.importorskip("httpx")
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request)
+            if str(request.url) == _WEBHOOKS[1]:
+                raise httpx.ConnectTimeout("timed out", request=request)
+            return httpx.Response(200, json={"code": 0, "msg": "success"})
+        
+        async def run():
+            notifier = AsyncFeishuNotifier(_WEBHOOKS)
+            await notifier.aclose()
+            notifier._client = httpx.AsyncClient(
+                headers=notifier.headers,
+                transport=httpx.MockTransport(handler)
+            )
+            async with notifier:
+                await notifier.send_text("测试消息")
+        
+        with pytest.raises(NotificationError, match=r"部分webhook发送失败 \(1/2\): 请求超时"):
+            asyncio.run(run())
+        
+        assert [str(request.url) for request in requests_seen] == _WEBHOOKS
+        assert requests_seen[0].headers['Content-Type'] == "application/json; charset=utf-8"
+        assert json.loads(requests_seen[0].content) == {
+            "msg_type": "text",
+            "content": {"text": "测试消息"}
+        }